@@ -3,23 +3,32 @@
 import pandas as pd
 import streamlit as st
 
+# sheet name -> keyword arguments for parsing the sheet
+CONTEXT_DATA_SHEETS = {
+    "demand_countries": {
+        "skiprows": 1,
+        "keep_default_na": False,
+        "index_col": "country_name",
+    },
+    "certification_schemes": {"skiprows": 1, "keep_default_na": False},
+    "sustainability": {},
+    "supply": {"skiprows": 1, "keep_default_na": False, "index_col": "country_name"},
+    "literature": {},
+}
+
 
 @st.cache_data(show_spinner=False)
 def load_context_data():
-    """Import context data from excel file."""
+    """Import context data from excel file.
+
+    The workbook is opened only once and all sheets are parsed from it.
+    """
     filename = "data/context_data.xlsx"
-    cd = {}
-    cd["demand_countries"] = pd.read_excel(
-        filename, sheet_name="demand_countries", skiprows=1, keep_default_na=False
-    )
-    cd["certification_schemes"] = pd.read_excel(
-        filename, sheet_name="certification_schemes", skiprows=1, keep_default_na=False
-    )
-    cd["sustainability"] = pd.read_excel(filename, sheet_name="sustainability")
-    cd["supply"] = pd.read_excel(
-        filename, sheet_name="supply", skiprows=1, keep_default_na=False
-    )
-    cd["literature"] = pd.read_excel(filename, sheet_name="literature")
+    with pd.ExcelFile(filename) as xl:
+        cd = {
+            sheet: xl.parse(sheet, **kwargs)
+            for sheet, kwargs in CONTEXT_DATA_SHEETS.items()
+        }
 
     return _insert_clickable_references(cd)
 
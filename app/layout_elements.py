@@ -18,6 +18,8 @@ from app.user_data import register_user_changes
 from ptxboa.api import PtxboaAPI
 
 
+# widget changes inside the cost panels only rerun the panel, not the whole app:
+@st.experimental_fragment
 def display_costs(
     df_costs: pd.DataFrame,
     df_costs_without_user_changes: pd.DataFrame,
@@ -57,10 +59,8 @@ def display_costs(
         if select_data == "Difference":
             df_res = df_costs - df_costs_without_user_changes
     else:
-        df_res = df_costs.copy()
-
-    if default_manual_select is None:
-        default_manual_select = df_res.index.values
+        # shallow copy: only the index name is changed below
+        df_res = df_costs.copy(deep=False)
 
     with c1:
         if len(df_res) > 13:
@@ -82,9 +82,12 @@ def display_costs(
 
         # apply filter:
         if show_which_data == "Manual selection":
+            options = df_res.index.tolist()
+            if default_manual_select is None:
+                default_manual_select = options
             ind_select = st.multiselect(
                 "Select elements:",
-                df_res.index.values,
+                options,
                 default=default_manual_select,
                 key=f"select_data_{key}_{key_suffix}",
                 label_visibility="collapsed",
@@ -13,6 +13,8 @@ import streamlit as st
 from app.ptxboa_functions import (
     change_index_names,
     get_data_type_from_input_data,
+    get_region_iso3166_codes,
+    get_user_data_hash,
     remove_subregions,
     select_subregions,
 )
@@ -47,7 +49,7 @@ def agora_discrete_colors_cost_categories() -> dict:
         "Derivative production",
         "Heat",
         "Carbon",
-        # TODO: add missing category (GH #145)
+        "Transportation (Pipeline)",
     ]
     return {c: st.session_state["colors"][i] for i, c in enumerate(cost_categories)}
 
@@ -77,6 +79,34 @@ def plot_costs_on_map(
     -------
     go.Figure
     """
+    # pass all session state values the figure depends on, so they are cache keys
+    return _plot_costs_on_map(
+        api,
+        res_costs,
+        scope,
+        cost_component,
+        output_unit=st.session_state["output_unit"],
+        color_scale=agora_continuous_color_scale(),
+        country=st.session_state["country"],
+        region=st.session_state["region"],
+        subregion=st.session_state["subregion"],
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _plot_costs_on_map(
+    _api: PtxboaAPI,
+    res_costs: pd.DataFrame,
+    scope: Literal["world", "Argentina", "Morocco", "South Africa"],
+    cost_component: str,
+    output_unit: str,
+    color_scale: list[tuple],
+    country: str,
+    region: str,
+    subregion: str | None,
+) -> go.Figure:
+    """Create map for cost result data, cached by all its inputs."""
+    api = _api
     if scope == "world":
         # Create a choropleth world map:
         fig = _choropleth_map_world(
@@ -84,6 +114,11 @@ def plot_costs_on_map(
             df=res_costs,
             color_col=cost_component,
             custom_data_func=_make_costs_hoverdata,
+            color_scale=color_scale,
+            country=country,
+            region=region,
+            subregion=subregion,
+            custom_data_func_kwargs={"output_unit": output_unit},
         )
 
     else:
@@ -93,9 +128,12 @@ def plot_costs_on_map(
             deep_dive_country=scope,
             color_col=cost_component,
             custom_data_func=_make_costs_hoverdata,
+            color_scale=color_scale,
+            region=region,
+            custom_data_func_kwargs={"output_unit": output_unit},
         )
 
-    return _set_map_layout(fig, colorbar_title=st.session_state["output_unit"])
+    return _set_map_layout(fig, colorbar_title=output_unit, scope=scope)
 
 
 def plot_input_data_on_map(
@@ -130,6 +168,36 @@ def plot_input_data_on_map(
     -------
     go.Figure
     """
+    # pass all session state values the figure depends on, so they are cache keys
+    return _plot_input_data_on_map(
+        api,
+        data_type,
+        color_col,
+        scope,
+        color_scale=agora_continuous_color_scale(),
+        scenario=st.session_state["scenario"],
+        user_data_hash=get_user_data_hash(st.session_state["user_changes_df"]),
+        country=st.session_state["country"],
+        region=st.session_state["region"],
+        subregion=st.session_state["subregion"],
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _plot_input_data_on_map(
+    _api: PtxboaAPI,
+    data_type: Literal["CAPEX", "full load hours", "WACC"],
+    color_col: str,
+    scope: Literal["world", "Argentina", "Morocco", "South Africa"],
+    color_scale: list[tuple],
+    scenario: str,
+    user_data_hash: str | None,
+    country: str,
+    region: str,
+    subregion: str | None,
+) -> go.Figure:
+    """Plot input data on a map, cached by all its inputs."""
+    api = _api
     input_data = get_data_type_from_input_data(api, data_type=data_type, scope=None)
 
     units = {"CAPEX": "USD/kW", "full load hours": "h/a", "WACC": "%"}
@@ -165,6 +233,10 @@ def plot_input_data_on_map(
             df=input_data,
             color_col=color_col,
             custom_data_func=_make_inputs_hoverdata,
+            color_scale=color_scale,
+            country=country,
+            region=region,
+            subregion=subregion,
             custom_data_func_kwargs=custom_data_func_kwargs,
         )
     else:
@@ -174,10 +246,14 @@ def plot_input_data_on_map(
             deep_dive_country=scope,
             color_col=color_col,
             custom_data_func=_make_inputs_hoverdata,
+            color_scale=color_scale,
+            region=region,
             custom_data_func_kwargs=custom_data_func_kwargs,
         )
 
-    return _set_map_layout(fig, colorbar_title=custom_data_func_kwargs["unit"])
+    return _set_map_layout(
+        fig, colorbar_title=custom_data_func_kwargs["unit"], scope=scope
+    )
 
 
 def _choropleth_map_world(
@@ -185,6 +261,10 @@ def _choropleth_map_world(
     df: pd.DataFrame,
     color_col: str,
     custom_data_func: callable,
+    color_scale: list[tuple],
+    country: str,
+    region: str,
+    subregion: str | None,
     custom_data_func_kwargs: dict | None = None,
 ):
     """
@@ -198,6 +278,14 @@ def _choropleth_map_world(
         column that should be displayed
     custom_data : list[pd.Series]
         custom data used for hovers
+    color_scale : list[tuple]
+        continuous color scale, see :func:`agora_continuous_color_scale`
+    country : str
+        selected demand country, removed from the map
+    region : str
+        selected supply region, highlighted on the map
+    subregion : str or None
+        selected supply subregion
 
     Returns
     -------
@@ -206,19 +294,19 @@ def _choropleth_map_world(
     """
     if custom_data_func_kwargs is None:
         custom_data_func_kwargs = {}
-    df = remove_subregions(
-        api=api, df=df, country_name=st.session_state["country"]
-    ).dropna(subset=color_col)
+    df = remove_subregions(api=api, df=df, country_name=country).dropna(
+        subset=color_col
+    )
     fig = px.scatter_geo(
         locations=df.index,
         locationmode="country names",
         color=df[color_col],
         custom_data=custom_data_func(df, **custom_data_func_kwargs),
-        color_continuous_scale=agora_continuous_color_scale(),
+        color_continuous_scale=color_scale,
         opacity=0.8,
     )
     fig.update_traces({"marker": {"size": 20}})
-    fig = _highlight_selected_region_world(fig)
+    fig = _highlight_selected_region_world(fig, region=region, subregion=subregion)
     return fig
 
 
@@ -228,6 +316,8 @@ def _choropleth_map_deep_dive_country(
     deep_dive_country: Literal["Argentina", "Morocco", "South Africa"],
     color_col: str,
     custom_data_func: callable,
+    color_scale: list[tuple],
+    region: str,
     custom_data_func_kwargs: dict | None = None,
 ):
     if custom_data_func_kwargs is None:
@@ -237,19 +327,10 @@ def _choropleth_map_deep_dive_country(
     df = select_subregions(df, deep_dive_country).dropna(subset=color_col)
     # need to calculate custom data befor is03166 column is appended.
     hover_data = custom_data_func(df, **custom_data_func_kwargs)
-    # get dataframe with info about iso 3166-2 codes and map them to res_costs
-    ddc_info = api.get_dimension("region")
-    df["iso3166_code"] = df.index.map(
-        pd.Series(ddc_info["iso3166_code"], index=ddc_info["region_name"])
-    )
+    # map iso 3166-2 codes to res_costs (a dict lookup skips index alignment)
+    df["iso3166_code"] = df.index.map(get_region_iso3166_codes(api))
     # load representative points data
-    lon_lat = pd.read_csv(
-        (
-            Path(__file__).parent.parent.resolve()
-            / "data"
-            / "subregion_representative_points.csv"
-        )
-    )
+    lon_lat = _load_subregion_representative_points()
     # merge points to data
     df = change_index_names(df, mapping={"source_region": "region"})
     df = df.reset_index().merge(lon_lat, left_on="iso3166_code", right_on="iso_3166_2")
@@ -259,12 +340,12 @@ def _choropleth_map_deep_dive_country(
         lat=df["lat"],
         color=df[color_col],
         custom_data=hover_data,
-        color_continuous_scale=agora_continuous_color_scale(),
+        color_continuous_scale=color_scale,
         opacity=0.8,
     )
     fig.update_traces({"marker": {"size": 20}})
 
-    fig = _highlight_selected_subregion(df, fig)
+    fig = _highlight_selected_subregion(df, fig, region=region)
 
     bboxes = {
         "Argentina": (-73.4154357571, -55.25, -53.628348965, -21.8323104794),
@@ -283,13 +364,25 @@ def _choropleth_map_deep_dive_country(
     return fig
 
 
-def _highlight_selected_subregion(df, fig):
-    if st.session_state["region"] in df["region"].tolist():
-        subreg = st.session_state["region"]
+@st.cache_data(show_spinner=False)
+def _load_subregion_representative_points() -> pd.DataFrame:
+    """Load the coordinates of the points that represent subregions on the map."""
+    return pd.read_csv(
+        (
+            Path(__file__).parent.parent.resolve()
+            / "data"
+            / "subregion_representative_points.csv"
+        )
+    )
+
+
+def _highlight_selected_subregion(df, fig, region: str):
+    is_selected = df["region"] == region
+    if is_selected.any():
         fig.add_trace(
             go.Scattergeo(
-                lon=df.loc[df["region"] == subreg, "lon"].tolist(),
-                lat=df.loc[df["region"] == subreg, "lat"].tolist(),
+                lon=df.loc[is_selected, "lon"].tolist(),
+                lat=df.loc[is_selected, "lat"].tolist(),
                 marker={
                     "size": 21,
                     "color": "rgba(0, 0, 0, 0)",
@@ -304,11 +397,11 @@ def _highlight_selected_subregion(df, fig):
     return fig
 
 
-def _highlight_selected_region_world(fig: go.Figure) -> go.Figure:
-    if st.session_state["subregion"] is not None:
-        region = st.session_state["region"].split(" (")[0]
-    else:
-        region = st.session_state["region"]
+def _highlight_selected_region_world(
+    fig: go.Figure, region: str, subregion: str | None
+) -> go.Figure:
+    if subregion is not None:
+        region = region.split(" (")[0]
 
     fig.add_trace(
         go.Scattergeo(
@@ -328,7 +421,7 @@ def _highlight_selected_region_world(fig: go.Figure) -> go.Figure:
     return fig
 
 
-def _set_map_layout(fig: go.Figure, colorbar_title: str) -> go.Figure:
+def _set_map_layout(fig: go.Figure, colorbar_title: str, scope: str) -> go.Figure:
     """
     Apply a unified layout for all maps used in the app.
 
@@ -342,6 +435,8 @@ def _set_map_layout(fig: go.Figure, colorbar_title: str) -> go.Figure:
         the figure title
     colorbar_title : str
         the title of the colorbar
+    scope : str
+        either "world" or a deep dive country, used as ui revision of the map
 
     Returns
     -------
@@ -368,6 +463,9 @@ def _set_map_layout(fig: go.Figure, colorbar_title: str) -> go.Figure:
         },
         margin={"t": 20, "b": 20, "l": 20, "r": 20},  # reduce margin around figure
         height=500,
+        # keep zoom/pan state and let plotly.js update the existing map in place
+        # when only the displayed parameter changes, but reset it for a new scope:
+        uirevision=scope,
     )
 
     # Set the hover template to use the custom data
@@ -399,19 +497,19 @@ def _make_inputs_hoverdata(df, data_type, map_variable, unit, float_precision):
     return [custom_hover_data]
 
 
-def _make_costs_hoverdata(res_costs: pd.DataFrame) -> list[pd.Series]:
+def _make_costs_hoverdata(res_costs: pd.DataFrame, output_unit: str) -> list[pd.Series]:
     custom_hover_data = res_costs.map("{:,.1f}".format).apply(
         lambda x: f"<b>{x.name}</b><br><br>"
         + "<br>".join(
             [
                 f"<b>{col}</b>: {x[col] if x[col] != 'nan' else 'not applicable'} "
-                f"{st.session_state['output_unit'] if x[col] != 'nan' else ''}"
+                f"{output_unit if x[col] != 'nan' else ''}"
                 for col in res_costs.columns[:-1]
             ]
             + [
                 f"──────────<br><b>{res_costs.columns[-1]}</b>: "
                 f"{x[res_costs.columns[-1]]}"
-                f"{st.session_state['output_unit']}"
+                f"{output_unit}"
             ]
         ),
         axis=1,
@@ -443,12 +541,39 @@ def create_bar_chart_costs(
     if res_costs.empty:  # nodata to plot (FIXME: migth not be required later)
         return go.Figure()
 
-    fig = px.bar(
-        res_costs,
-        x=res_costs.index,
-        y=res_costs.columns[:-1],
+    if output_unit is None:
+        output_unit = st.session_state["output_unit"]
+
+    colors = agora_discrete_colors_cost_categories()
+    # cost components without a category color cycle through the colors that
+    # are not used by any category:
+    unused_colors = [c for c in st.session_state["colors"] if c not in colors.values()]
+    unmapped_columns = [c for c in res_costs.columns[:-1] if c not in colors]
+    for i, col in enumerate(unmapped_columns):
+        colors[col] = unused_colors[i % len(unused_colors)]
+
+    # one stacked bar trace per cost component, built directly from the arrays
+    # instead of letting plotly express melt the data frame:
+    x = res_costs.index.to_numpy()
+    index_name = res_costs.index.name or "index"
+    fig = go.Figure()
+    for col in res_costs.columns[:-1]:
+        fig.add_bar(
+            x=x,
+            y=res_costs[col].to_numpy(),
+            name=col,
+            marker_color=colors[col],
+            hovertemplate=(
+                f"variable={col}<br>{index_name}=%{{x}}<br>value=%{{y}}<extra></extra>"
+            ),
+        )
+    fig.update_layout(
+        barmode="relative",
         height=500,
-        color_discrete_map=agora_discrete_colors_cost_categories(),
+        legend_title_text="variable",
+        margin={"t": 60},
+        xaxis_title=index_name,
+        yaxis_title="value",
     )
 
     # Add the dot markers for the "total" column using plotly.graph_objects
@@ -458,9 +583,8 @@ def create_bar_chart_costs(
         mode="markers+text",  # Display markers and text
         marker={"size": 10, "color": "black"},
         name="Total",
-        text=res_costs["Total"].apply(
-            lambda x: f"{x:.0f}"
-        ),  # Use 'total' column values as text labels
+        # Use 'total' column values as text labels
+        text=np.char.mod("%.0f", res_costs["Total"].to_numpy(dtype=np.float64)),
         textposition="top center",  # Position of the text label above the marker
     )
 
@@ -491,30 +615,40 @@ def create_bar_chart_costs(
     fig.update_yaxes(tickformat=",")
     fig.update_layout(separators=". ")
 
-    if output_unit is None:
-        output_unit = st.session_state["output_unit"]
-
     fig.update_layout(yaxis_title=output_unit)
     fig.update_layout(legend_traceorder="reversed")
     return fig
 
 
-def create_box_plot(res_costs: pd.DataFrame):
+def create_box_plot(
+    res_costs: pd.DataFrame,
+    fig: go.Figure | None = None,
+    row: int | None = None,
+    col: int | None = None,
+    showlegend: bool | None = None,
+):
     """Create a subplot with one row and one column.
 
     Parameters
     ----------
     res_costs : pd.DataFrame
         data for plotting
-    settings : dict
-        settings dictionary, like output from create_sidebar()
+    fig : plotly.graph_objects.Figure or None
+        if given, add the traces to this figure (at ``row`` and ``col``) instead
+        of creating a new figure. The layout of ``fig`` is not changed.
+    row, col : int or None
+        subplot position in ``fig``
+    showlegend : bool or None
+        show the traces in the legend, by default use the plotly default
 
     Output
     ------
     fig : plotly.graph_objects.Figure
         Figure object
     """
-    fig = go.Figure()
+    add_to_existing_figure = fig is not None
+    if not add_to_existing_figure:
+        fig = go.Figure()
 
     # Specify the row index of the data point you want to highlight
     highlighted_row_index = st.session_state["region"]
@@ -525,21 +659,29 @@ def create_box_plot(res_costs: pd.DataFrame):
     else:
         highlighted_value = 0
 
-    # Add the box plot to the subplot
-    fig.add_trace(go.Box(y=res_costs["Total"], name="Cost distribution"))
-
-    # Add a scatter marker for the highlighted data point
-    fig.add_trace(
-        go.Scatter(
-            x=["Cost distribution"],
-            y=[highlighted_value],
-            mode="markers",
-            marker={"size": 10, "color": "black"},
-            name=highlighted_row_index,
-            text=f"Value: {highlighted_value}",  # Add a text label
-        )
+    # Add the box plot and a scatter marker for the highlighted data point
+    fig.add_traces(
+        [
+            go.Box(
+                y=res_costs["Total"], name="Cost distribution", showlegend=showlegend
+            ),
+            go.Scatter(
+                x=["Cost distribution"],
+                y=[highlighted_value],
+                mode="markers",
+                marker={"size": 10, "color": "black"},
+                name=highlighted_row_index,
+                text=f"Value: {highlighted_value}",  # Add a text label
+                showlegend=showlegend,
+            ),
+        ],
+        rows=row,
+        cols=col,
     )
 
+    if add_to_existing_figure:
+        return fig
+
     # Customize the layout as needed
     fig.update_layout(
         title="Cost distribution for all supply countries",
@@ -552,8 +694,8 @@ def create_box_plot(res_costs: pd.DataFrame):
 
 
 def create_scatter_plot(df_res, settings: dict):
-    df_res["Country"] = "Other countries"
-    df_res.at[st.session_state["region"], "Country"] = st.session_state["region"]
+    region = st.session_state["region"]
+    df_res["Country"] = np.where(df_res.index == region, region, "Other countries")
 
     fig = px.scatter(
         df_res,
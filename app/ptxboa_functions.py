@@ -1,23 +1,130 @@
 # -*- coding: utf-8 -*-
 """Utility functions for streamlit app."""
+import hashlib
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Literal
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from ptxboa.api import PtxboaAPI
 from ptxboa.utils import is_test
 
+# order of the cost types in a chain, used for the column order of results
+_COST_TYPE_ORDER = (
+    "Electricity generation",
+    "Electrolysis",
+    "Electricity and H2 storage",
+    "Derivative production",
+    "Heat",
+    "Water",
+    "Carbon",
+    "Transportation (Pipeline)",
+    "Transportation (Ship)",
+    "Total",
+)
+_COST_TYPE_ORDER_INDEX = pd.Index(_COST_TYPE_ORDER)
+
+# countries with subregions that can be selected as regional scope
+DEEP_DIVE_COUNTRIES = frozenset({"Argentina", "Morocco", "South Africa"})
+
+# default display names for index names, see `change_index_names`
+_INDEX_NAME_MAPPING = {
+    "process_code": "Process",
+    "source_region_code": "Source region",
+    "region": "Source region",
+    "source_region": "Source region",
+    "scenario": "Scenario",
+    "res_gen": "RE source",
+    "chain": "Chain",
+    "flow_code": "Carrier/Material",
+}
+
+
+def get_user_data_hash(user_data: pd.DataFrame | None) -> str | None:
+    """Return a short content hash of the user data.
+
+    The hash is used as cache key instead of the user data frame itself.
+    """
+    if user_data is None:
+        return None
+    return hashlib.blake2b(
+        pd.util.hash_pandas_object(user_data, index=True).to_numpy().tobytes(),
+        digest_size=16,
+    ).hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def get_input_data(
+    _api: PtxboaAPI,
+    scenario: str,
+    long_names: bool = True,
+    _user_data: pd.DataFrame | None = None,
+    user_data_hash: str | None = None,
+) -> pd.DataFrame:
+    """Get input data, cached per scenario and user data.
+
+    Parameters
+    ----------
+    api : :class:`~ptxboa.api.PtxboaAPI`
+        an instance of the api class
+    scenario : str
+        name of data scenario
+    long_names : bool, optional
+        see :meth:`~ptxboa.api.PtxboaAPI.get_input_data()`
+    _user_data : pd.DataFrame | None
+        user data, not hashed by streamlit
+    user_data_hash : str | None
+        cache key of the user data, see :func:`get_user_data_hash`
+
+    Returns
+    -------
+    pd.DataFrame
+        same format as for :meth:`~ptxboa.api.PtxboaAPI.get_input_data()`
+    """
+    return _api.get_input_data(scenario, long_names=long_names, user_data=_user_data)
+
 
 @st.cache_data(show_spinner=False)
+def get_transport_distances(_api: PtxboaAPI, scenario: str) -> pd.DataFrame:
+    """Get shipping and pipeline distances, cached per scenario.
+
+    Parameters
+    ----------
+    api : :class:`~ptxboa.api.PtxboaAPI`
+        an instance of the api class
+    scenario : str
+        name of data scenario
+
+    Returns
+    -------
+    pd.DataFrame
+        index levels are "source_region_code" and "target_country_code", columns
+        are "pipeline distance" and "shipping distance".
+    """
+    input_data = get_input_data(_api, scenario)
+    distances = input_data.loc[
+        input_data["parameter_code"].isin(["shipping distance", "pipeline distance"])
+    ]
+    return (
+        distances.groupby(
+            ["source_region_code", "target_country_code", "parameter_code"]
+        )["value"]
+        .sum()
+        .unstack("parameter_code")
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=2048)
 def calculate_results_single(
     _api: PtxboaAPI,
     settings: dict,
-    user_data: pd.DataFrame | None = None,
+    _user_data: pd.DataFrame | None = None,
+    user_data_hash: str | None = None,
     optimize_flh: bool = True,
-    use_user_data_for_optimize_flh: bool = False,
 ) -> pd.DataFrame:
     """Calculate results for a single set of settings.
 
@@ -27,7 +134,13 @@ def calculate_results_single(
         an instance of the api class
     settings : dict
         settings from the streamlit app. An example can be obtained with the
-        return value from :func:`ptxboa_functions.create_sidebar`.
+        return value from :func:`ptxboa_functions.create_sidebar`. Can contain
+        "use_user_data_for_optimize_flh", which is passed on to
+        :meth:`~ptxboa.api.PtxboaAPI.calculate()`.
+    _user_data : pd.DataFrame | None
+        user data, not hashed by streamlit
+    user_data_hash : str | None
+        cache key of the user data, see :func:`get_user_data_hash`
 
     Returns
     -------
@@ -35,10 +148,9 @@ def calculate_results_single(
         same format as for :meth:`~ptxboa.api.PtxboaAPI.calculate()`
     """
     res, _metadata = _api.calculate(
-        user_data=user_data,
+        user_data=_user_data,
         **settings,
         optimize_flh=optimize_flh,
-        use_user_data_for_optimize_flh=use_user_data_for_optimize_flh,
     )
 
     return res
@@ -119,72 +231,124 @@ def calculate_results_list(
 
     # drop Green Iron if comparing chains (because it is not an energy carrier)
     if parameter_to_change == "chain":
-        parameter_list = parameter_list[~parameter_list.str.startswith("Green Iron")]
+        parameter_list = parameter_list[
+            parameter_list.isin(_get_chains_without_green_iron(api))
+        ]
 
-    res_list = []
+    # build one new settings dict per parameter on top of the shared settings:
+    settings_list = []
     for parameter in parameter_list:
-        settings.update({parameter_to_change: parameter})
+        parameter_settings = settings | {parameter_to_change: parameter}
 
         if parameter_to_change == "chain":
             needs_co2 = check_if_input_is_needed(
                 api,
                 flow_code="CO2-G",
-                chain=settings["chain"],
+                chain=parameter,
                 scenario=settings["scenario"],
             )
             # if the current chain does not need CO2, set "secproc_co2" to None
             if needs_co2:
-                settings.update({"secproc_co2": st.session_state["secproc_co2"]})
+                parameter_settings["secproc_co2"] = st.session_state["secproc_co2"]
             else:
-                settings.update({"secproc_co2": None})
+                parameter_settings["secproc_co2"] = None
 
         # for all regions but the selected one, use Wind-PV-hybrid RE source:
         if parameter_to_change == "region":
-            if settings["region"] == st.session_state["region"]:
-                settings["res_gen"] = st.session_state["res_gen"]
+            if parameter == st.session_state["region"]:
+                parameter_settings["res_gen"] = st.session_state["res_gen"]
             else:
-                settings["res_gen"] = "Wind-PV-Hybrid"
+                parameter_settings["res_gen"] = "Wind-PV-Hybrid"
 
         # consider user data in optimization only for parameter set in session state
-        if st.session_state[parameter_to_change] == parameter:
-            use_user_data_for_optimize_flh = True
-        else:
-            use_user_data_for_optimize_flh = False
+        parameter_settings["use_user_data_for_optimize_flh"] = (
+            st.session_state[parameter_to_change] == parameter
+        )
 
+        settings_list.append(parameter_settings)
+
+    user_data = st.session_state["user_changes_df"] if apply_user_data else None
+    return _calculate_aggregated_costs(
+        api,
+        settings_list,
+        parameter_to_change,
+        _user_data=user_data,
+        user_data_hash=get_user_data_hash(user_data),
+        optimize_flh=optimize_flh,
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=256)
+def _calculate_aggregated_costs(
+    _api: PtxboaAPI,
+    settings_list: list[dict],
+    parameter_to_change: str,
+    _user_data: pd.DataFrame | None,
+    user_data_hash: str | None,
+    optimize_flh: bool,
+) -> pd.DataFrame:
+    """Calculate and aggregate costs, cached so that reruns skip the aggregation."""
+    # each settings dict goes through the cache of calculate_results_single, so
+    # only settings that changed since the last call are recalculated:
+    res_details = _calculate_results_one_by_one(
+        _api,
+        settings_list,
+        user_data=_user_data,
+        user_data_hash=user_data_hash,
+        optimize_flh=optimize_flh,
+    )
+
+    return aggregate_costs(res_details, parameter_to_change)
+
+
+@st.cache_resource()
+def _get_chains_without_green_iron(_api: PtxboaAPI) -> frozenset[str]:
+    """Get all chains that produce an energy carrier."""
+    chains = _api.get_dimension("chain").index
+    return frozenset(chains[~chains.str.startswith("Green Iron")])
+
+
+def _calculate_results_one_by_one(
+    api: PtxboaAPI,
+    settings_list: list[dict],
+    user_data: pd.DataFrame | None,
+    user_data_hash: str | None,
+    optimize_flh: bool,
+) -> pd.DataFrame:
+    """Calculate results for each settings and skip the ones that fail."""
+    res_list = []
+    for settings in settings_list:
         # catch all api errors so that the tool is stable
         try:
             res_single = calculate_results_single(
                 api,
                 settings,
-                user_data=(
-                    st.session_state["user_changes_df"] if apply_user_data else None
-                ),
+                _user_data=user_data,
+                user_data_hash=user_data_hash,
                 optimize_flh=optimize_flh,
-                use_user_data_for_optimize_flh=use_user_data_for_optimize_flh,
             )
             res_list.append(res_single)
         except Exception as exc:
             logging.info(f"could not get data: {exc}")
 
-    res_details = pd.concat(res_list)
-
-    return aggregate_costs(res_details, parameter_to_change)
+    # all frames have the same columns, so there is nothing to align or sort:
+    return pd.concat(res_list, ignore_index=True, sort=False, copy=False)
 
 
 def aggregate_costs(
     res_details: pd.DataFrame, parameter_to_change: str
 ) -> pd.DataFrame:
     """Aggregate detailed costs."""
-    # Exclude levelized costs:
-    res = res_details.loc[res_details["cost_type"] != "LC"]
-    res = res.pivot_table(
-        index=parameter_to_change,
-        columns="process_type",
-        values="values",
-        aggfunc="sum",
+    # Exclude levelized costs (boolean mask on the underlying array):
+    mask = res_details["cost_type"].to_numpy() != "LC"
+    res = res_details[mask]
+    # same result as `pivot_table(aggfunc="sum")`, without its overhead:
+    res = (
+        res.groupby([parameter_to_change, "process_type"])["values"]
+        .sum()
+        .unstack("process_type")
     )
-    # calculate total costs:
-    res["Total"] = res.sum(axis=1)
+    res["Total"] = np.nansum(res.to_numpy(), axis=1)
 
     return sort_cost_type_columns_by_position_in_chain(res)
 
@@ -197,28 +361,16 @@ def sort_cost_type_columns_by_position_in_chain(df):
     Parameters
     ----------
     df : pd.DataFrame
-        columns need to be in 'cost_type_order'
+        columns need to be in `_COST_TYPE_ORDER`
 
     Returns
     -------
     pd.DataFrame
         same data with changed order of columns.
     """
-    #
-    cost_type_order = [
-        "Electricity generation",
-        "Electrolysis",
-        "Electricity and H2 storage",
-        "Derivative production",
-        "Heat",
-        "Water",
-        "Carbon",
-        "Transportation (Pipeline)",
-        "Transportation (Ship)",
-        "Total",
-    ]
-    assert [c in cost_type_order for c in df.columns]
-    cols = [c for c in cost_type_order if c in df.columns]
+    unknown = set(df.columns) - set(_COST_TYPE_ORDER)
+    assert not unknown, f"unknown cost type columns: {unknown}"
+    cols = _COST_TYPE_ORDER_INDEX.intersection(df.columns, sort=False)
     return df[cols]
 
 
@@ -230,6 +382,7 @@ def subset_and_pivot_input_data(
     index: str = "source_region_code",
     columns: str = "process_code",
     values: str = "value",
+    index_values: list = None,
 ):
     """
     Reshapes and subsets input data.
@@ -250,23 +403,30 @@ def subset_and_pivot_input_data(
         column for generating new columns in pivot_table, by default "process_code"
     values : str, optional
         values for `pivot_table()` , by default "value"
+    index_values : list, optional
+        list for subsetting the values of the `index` column before pivoting,
+        by default None
 
     Returns
     -------
     : pd.DataFrame
     """
-    if source_region_code is not None:
-        input_data = input_data.loc[
-            input_data["source_region_code"].isin(source_region_code)
-        ]
-    if parameter_code is not None:
-        input_data = input_data.loc[input_data["parameter_code"].isin(parameter_code)]
-    if process_code is not None:
-        input_data = input_data.loc[input_data["process_code"].isin(process_code)]
-
-    reshaped = input_data.pivot_table(
-        index=index, columns=columns, values=values, aggfunc="sum"
-    )
+    # combine all filters into a single mask to only copy the data once
+    mask = np.ones(len(input_data), dtype=bool)
+    for col, selection in [
+        ("source_region_code", source_region_code),
+        ("parameter_code", parameter_code),
+        ("process_code", process_code),
+        (index, index_values),
+    ]:
+        if selection is not None:
+            mask &= input_data[col].isin(selection).to_numpy()
+    if not mask.all():
+        input_data = input_data.loc[mask]
+
+    # same result as `pivot_table(aggfunc="sum")` for data without missing values,
+    # but without the overhead of the general pivot_table implementation
+    reshaped = input_data.groupby([index, columns])[values].sum().unstack(columns)
     return reshaped
 
 
@@ -322,167 +482,157 @@ def get_data_type_from_input_data(
             index="source_region",
             columns="res_gen",
             values="value",
+            index_values=_get_regions_in_scope(api, scope),
         )
-        if scope == "world":
-            df = remove_subregions(
-                api=api, df=df, country_name=st.session_state["country"]
-            )
-        if scope in ["Argentina", "Morocco", "South Africa"]:
-            df = select_subregions(df, scope)
         return df
 
-    input_data = api.get_input_data(
+    input_data = get_input_data(
+        api,
         st.session_state["scenario"],
-        user_data=st.session_state["user_changes_df"],
+        _user_data=st.session_state["user_changes_df"],
+        user_data_hash=get_user_data_hash(st.session_state["user_changes_df"]),
     )
 
-    if data_type in [
-        "electricity_generation",
-        "conversion_processes",
-        "transportation_processes",
-        "reconversion_processes",
-        "dac_and_desalination",
-        "storage",
-    ]:
-        scope = None
-        source_region_code = [""]
-        index = "process_code"
-        columns = "parameter_code"
-        processes = api.get_dimension("process")
-
-    if data_type == "specific_costs":
-        scope = None
-        source_region_code = [""]
-        index = "flow_code"
-        columns = "parameter_code"
-        parameter_code = ["specific costs"]
-        process_code = [""]
-
-    if data_type == "conversion_coefficients":
+    selection = _get_input_data_selections(api)[data_type]
+    # data that is not region specific is only given for source region "":
+    if selection["source_region_code"] is not None:
         scope = None
-        source_region_code = [""]
-        index = "process_code"
-        columns = "flow_code"
-        parameter_code = ["conversion factors"]
-        process_code = input_data.loc[
-            input_data["parameter_code"] == "conversion factors", "process_code"
-        ].unique()
-
-    if data_type == "electricity_generation":
-        parameter_code = [
-            "CAPEX",
-            "OPEX (fix)",
-            "lifetime / amortization period",
-            "efficiency",
-        ]
-        process_code = processes.loc[
-            processes["is_re_generation"], "process_name"
-        ].to_list()
-
-    if data_type == "conversion_processes":
-        parameter_code = [
-            "CAPEX",
-            "OPEX (fix)",
-            "lifetime / amortization period",
-            "efficiency",
-        ]
-        process_code = processes.loc[
-            ~processes["is_transport"]
-            & ~processes["is_re_generation"]
-            & ~processes["is_secondary"],
-            "process_name",
-        ].to_list()
-
-    if data_type == "dac_and_desalination":
-        parameter_code = [
-            "CAPEX",
-            "OPEX (fix)",
-            "lifetime / amortization period",
-        ]
-        process_code = processes.loc[
-            processes["is_secondary"], "process_name"
-        ].to_list()
-
-    if data_type == "transportation_processes":
-        parameter_code = [
-            "losses (own fuel, transport)",
-            "levelized costs",
-            "lifetime / amortization period",
-        ]
-        process_code = processes.loc[
-            processes["is_transport"] & ~processes["is_transformation"], "process_name"
-        ].to_list()
-        # remove storage processes
-        process_code = [c for c in process_code if "storage" not in c]
-
-    if data_type == "reconversion_processes":
-        parameter_code = [
-            "CAPEX",
-            "OPEX (fix)",
-            "lifetime / amortization period",
-            "efficiency",
-        ]
-        process_code = processes.loc[
-            processes["is_transport"] & processes["is_transformation"], "process_name"
-        ].to_list()
-
-    if data_type in ["CAPEX", "WACC"]:
-        source_region_code = None
-        parameter_code = [data_type]
-        index = "source_region_code"
-
-    if data_type == "WACC":
-        columns = "parameter_code"
-        process_code = [""]
-
-    if data_type == "CAPEX":
-        columns = "process_code"
-        process_code = [
-            "Wind Onshore",
-            "Wind Offshore",
-            "PV tilted",
-        ]
-
-    if data_type == "storage":
-        parameter_code = [
-            "CAPEX",
-            "OPEX (fix)",
-            "lifetime / amortization period",
-            "efficiency",
-        ]
-        process_code = processes.loc[
-            processes["process_name"].str.contains("storage"), "process_name"
-        ].to_list()
 
+    # filter regions before pivoting:
     df = subset_and_pivot_input_data(
         input_data,
-        source_region_code=source_region_code,
-        parameter_code=parameter_code,
-        process_code=process_code,
-        index=index,
-        columns=columns,
+        **selection,
         values="value",
+        index_values=_get_regions_in_scope(api, scope),
     )
 
     # remove electricity from specific costs
     if data_type == "specific_costs":
         df = df[~(df.index == "electricity")]
 
-    if scope == "world":
-        df = remove_subregions(api=api, df=df, country_name=st.session_state["country"])
-    if scope in ["Argentina", "Morocco", "South Africa"]:
-        df = select_subregions(df, scope)
-
     # transform data to match unit [%] for 'WACC' and 'efficieny'
     if data_type == "WACC":
-        df = df * 100
+        df *= 100
 
     if "efficiency" in df.columns:
-        df["efficiency"] = df["efficiency"] * 100
+        df["efficiency"] *= 100
 
     return df
 
 
+def _get_regions_in_scope(
+    api: PtxboaAPI,
+    scope: Literal[None, "world", "Argentina", "Morocco", "South Africa"],
+) -> list | None:
+    """Get the source regions shown for a regional scope.
+
+    Same selection as :func:`remove_subregions` for "world" and
+    :func:`select_subregions` for the deep dive countries. None means no filter.
+    """
+    if scope == "world":
+        return get_region_list_without_subregions(
+            api, country_name=st.session_state["country"], keep=None
+        )
+    if scope in DEEP_DIVE_COUNTRIES:
+        return list(get_subregions(api)[scope])
+    return None
+
+
+@st.cache_resource()
+def _get_input_data_selections(_api: PtxboaAPI) -> dict:
+    """Get the arguments for :func:`subset_and_pivot_input_data` per data type.
+
+    The selections only depend on the process dimension and are computed once.
+    The returned dict is shared between sessions and must not be modified.
+    """
+    processes = _api.get_dimension("process")
+    process_names = processes["process_name"]
+    is_transport = processes["is_transport"]
+    is_transformation = processes["is_transformation"]
+    is_re_generation = processes["is_re_generation"]
+    is_secondary = processes["is_secondary"]
+    is_storage = process_names.str.contains("storage")
+
+    tech_parameters = ("CAPEX", "OPEX (fix)", "lifetime / amortization period")
+    global_processes = {
+        "source_region_code": ("",),
+        "index": "process_code",
+        "columns": "parameter_code",
+    }
+
+    return {
+        "electricity_generation": global_processes
+        | {
+            "parameter_code": tech_parameters + ("efficiency",),
+            "process_code": tuple(process_names[is_re_generation]),
+        },
+        "conversion_processes": global_processes
+        | {
+            "parameter_code": tech_parameters + ("efficiency",),
+            "process_code": tuple(
+                process_names[~is_transport & ~is_re_generation & ~is_secondary]
+            ),
+        },
+        "dac_and_desalination": global_processes
+        | {
+            "parameter_code": tech_parameters,
+            "process_code": tuple(process_names[is_secondary]),
+        },
+        "transportation_processes": global_processes
+        | {
+            "parameter_code": (
+                "losses (own fuel, transport)",
+                "levelized costs",
+                "lifetime / amortization period",
+            ),
+            # storage processes are shown separately
+            "process_code": tuple(
+                process_names[is_transport & ~is_transformation & ~is_storage]
+            ),
+        },
+        "reconversion_processes": global_processes
+        | {
+            "parameter_code": tech_parameters + ("efficiency",),
+            "process_code": tuple(process_names[is_transport & is_transformation]),
+        },
+        "storage": global_processes
+        | {
+            "parameter_code": tech_parameters + ("efficiency",),
+            "process_code": tuple(process_names[is_storage]),
+        },
+        "specific_costs": {
+            "source_region_code": ("",),
+            "parameter_code": ("specific costs",),
+            "process_code": ("",),
+            "index": "flow_code",
+            "columns": "parameter_code",
+        },
+        # conversion factors are only given for the processes that have them,
+        # filtering by parameter is sufficient:
+        "conversion_coefficients": {
+            "source_region_code": ("",),
+            "parameter_code": ("conversion factors",),
+            "process_code": None,
+            "index": "process_code",
+            "columns": "flow_code",
+        },
+        "CAPEX": {
+            "source_region_code": None,
+            "parameter_code": ("CAPEX",),
+            "process_code": ("Wind Onshore", "Wind Offshore", "PV tilted"),
+            "index": "source_region_code",
+            "columns": "process_code",
+        },
+        "WACC": {
+            "source_region_code": None,
+            "parameter_code": ("WACC",),
+            "process_code": ("",),
+            "index": "source_region_code",
+            "columns": "parameter_code",
+        },
+    }
+
+
 def remove_subregions(
     api: PtxboaAPI, df: pd.DataFrame, country_name: str, keep: str | None = None
 ):
@@ -511,12 +661,9 @@ def remove_subregions(
         api, country_name=country_name, keep=keep
     )
 
-    # sometimes, not all regions exist
-    region_list_without_subregions = [
-        r for r in region_list_without_subregions if r in df.index
-    ]
-
-    df = df.loc[region_list_without_subregions]
+    # sometimes, not all regions exist. Select with a vectorized mask and keep the
+    # sorted order of the region list:
+    df = df.loc[df.index.isin(region_list_without_subregions)].sort_index()
 
     return df
 
@@ -540,20 +687,48 @@ def get_region_list_without_subregions(api, country_name, keep):
     -------
     list[str]
     """
-    region_list_without_subregions = (
-        api.get_dimension("region")
-        .loc[api.get_dimension("region")["subregion_code"] == ""]
-        .index.to_list()
-    )
-
     # ensure that target country is not in list of regions:
-    if country_name in region_list_without_subregions:
-        region_list_without_subregions.remove(country_name)
+    region_list_without_subregions = [
+        region
+        for region in get_sorted_regions_without_subregions(api)
+        if region != country_name
+    ]
 
     if keep is not None:
         region_list_without_subregions.append(keep)
+        region_list_without_subregions.sort()
+
+    return region_list_without_subregions
 
-    return sorted(region_list_without_subregions)
+
+@st.cache_resource()
+def get_sorted_regions_without_subregions(_api: PtxboaAPI) -> tuple[str, ...]:
+    """Get the sorted names of all regions that are not subregions."""
+    regions = _api.get_dimension("region")
+    return tuple(sorted(regions.index[regions["subregion_code"] == ""]))
+
+
+@st.cache_resource()
+def get_subregions(_api: PtxboaAPI) -> dict[str, tuple[str, ...]]:
+    """Get the subregions of each deep dive country.
+
+    The returned dict is shared between sessions and must not be modified.
+    """
+    regions = _api.get_dimension("region").index
+    return {
+        country: tuple(regions[regions.str.startswith(f"{country} (")])
+        for country in sorted(DEEP_DIVE_COUNTRIES)
+    }
+
+
+@st.cache_resource()
+def get_region_iso3166_codes(_api: PtxboaAPI) -> dict[str, str]:
+    """Get a mapping from region name to ISO 3166 code.
+
+    The returned dict is shared between sessions and must not be modified.
+    """
+    regions = _api.get_dimension("region")
+    return dict(zip(regions["region_name"], regions["iso3166_code"]))
 
 
 def select_subregions(
@@ -573,19 +748,15 @@ def select_subregions(
     -------
     pd.DataFrame
     """
-    df = df.copy().loc[df.index.str.startswith(f"{deep_dive_country} ("), :]
+    # boolean indexing already returns a new frame, no need to copy first:
+    df = df.loc[df.index.str.startswith(f"{deep_dive_country} ("), :]
     return df
 
 
 def config_number_columns(df: pd.DataFrame, **kwargs) -> Dict:
     """Create number column config info for st.dataframe() or st.data_editor."""
-    column_config_all = {}
-    for c in df.columns:
-        column_config_all[c] = st.column_config.NumberColumn(
-            **kwargs,
-        )
-
-    return column_config_all
+    # all columns share the same config, streamlit copies it before using it:
+    return dict.fromkeys(df.columns, st.column_config.NumberColumn(**kwargs))
 
 
 def move_to_tab(tab_name):
@@ -603,8 +774,12 @@ def move_to_tab(tab_name):
     st.session_state[st.session_state["tab_key"]] = tab_name
 
 
+@lru_cache(maxsize=None)
 def read_markdown_file(markdown_file: str) -> str:
-    """Import markdown file as string."""
+    """Import markdown file as string.
+
+    Markdown files are static, so each file is only read once per process.
+    """
     return Path(markdown_file).read_text(encoding="UTF-8")
 
 
@@ -619,7 +794,16 @@ def get_region_from_subregion(subregion: str) -> str:
 
 
 def get_column_config() -> dict:
-    """Define column configuration for dataframe display."""
+    """Define column configuration for dataframe display.
+
+    Returns a shallow copy of the cached configuration, so callers can add or
+    replace entries without affecting other tables.
+    """
+    return _get_column_config().copy()
+
+
+@st.cache_resource()
+def _get_column_config() -> dict:
     column_config = {
         "CAPEX": st.column_config.NumberColumn(format="%.0f USD/kW", min_value=0),
         "OPEX (fix)": st.column_config.NumberColumn(format="%.0f USD/kW", min_value=0),
@@ -698,18 +882,8 @@ def change_index_names(df: pd.DataFrame, mapping: dict | None = None) -> pd.Data
     used.
     """
     if mapping is None:
-        mapping = {
-            "process_code": "Process",
-            "source_region_code": "Source region",
-            "region": "Source region",
-            "source_region": "Source region",
-            "scenario": "Scenario",
-            "res_gen": "RE source",
-            "chain": "Chain",
-            "flow_code": "Carrier/Material",
-        }
-    new_idx_names = [mapping.get(i, i) for i in df.index.names]
-    df.index.names = new_idx_names
+        mapping = _INDEX_NAME_MAPPING
+    df.rename_axis(index=mapping, inplace=True)
     return df
 
 
@@ -722,18 +896,26 @@ def check_if_input_is_needed(
     if scenario is None:
         scenario = st.session_state["scenario"]
 
-    # get list of processes in selected chain:
-    process_codes = api.get_dimension("chain").loc[chain][:-1].to_list()
-    process_codes = [p for p in process_codes if p != ""]
+    return flow_code in _get_required_flows_per_chain(api, scenario)[chain]
 
-    # get list of conversion coefficients for these processes:
-    df = api.get_input_data(scenario=scenario, long_names=False)
-    flow_codes = df.loc[
-        (df["process_code"].isin(process_codes)) & (df["parameter_code"] == "CONV"),
-        "flow_code",
-    ].to_list()
 
-    return flow_code in flow_codes
+@st.cache_resource()
+def _get_required_flows_per_chain(
+    _api: PtxboaAPI, scenario: str
+) -> dict[str, frozenset[str]]:
+    """Get the flow codes with conversion coefficients for each chain."""
+    df = _api.get_input_data(scenario=scenario, long_names=False)
+    conv = df.loc[df["parameter_code"] == "CONV"]
+    flows_per_process = conv.groupby("process_code")["flow_code"].agg(frozenset)
+
+    required_flows = {}
+    for chain, row in _api.get_dimension("chain").iterrows():
+        # all columns except the last one ("CAN_PIPELINE") can contain processes:
+        process_codes = [p for p in row.iloc[:-1] if p != ""]
+        required_flows[chain] = frozenset().union(
+            *(flows_per_process.get(p, frozenset()) for p in process_codes)
+        )
+    return required_flows
 
 
 def costs_over_dimension(api, dim, parameter_list=None, override_session_state=None):
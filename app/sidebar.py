@@ -2,10 +2,27 @@
 """Sidebar creation."""
 import streamlit as st
 
-from app.ptxboa_functions import read_markdown_file
+from app.ptxboa_functions import (
+    DEEP_DIVE_COUNTRIES,
+    get_sorted_regions_without_subregions,
+    get_subregions,
+    read_markdown_file,
+)
 from app.user_data import reset_user_changes
 from ptxboa.api import PtxboaAPI
 
+_PRODUCTS = (
+    "Ammonia",
+    "Green Iron",
+    "Hydrogen",
+    "LOHC",
+    "Methane",
+    "Methanol",
+    "FT e-fuels",
+)
+_ELECTROLYZERS = ("AEL", "PEM", "SOEC")
+_RECONVERSION_PRODUCTS = frozenset({"Ammonia", "Methane"})
+
 
 @st.cache_resource()
 def sidebar_logo():
@@ -47,32 +64,23 @@ def make_sidebar(api: PtxboaAPI):
 
 def main_settings(api):
     # get list of regions that does not contain subregions:
-    region_list = (
-        api.get_dimension("region")
-        .loc[api.get_dimension("region")["subregion_code"] == ""]
-        .sort_index()
-        .index
-    )
+    region_list = get_sorted_regions_without_subregions(api)
 
     # select region:
     region = st.selectbox(
         "Supply country / region:",
         region_list,
         help=(read_markdown_file("md/helptext_sidebar_supply_region.md")),
-        index=region_list.get_loc("Morocco"),  # Morocco as default
+        index=region_list.index("Morocco"),  # Morocco as default
     )
     st.session_state["region"] = region
     st.session_state["subregion"] = None
 
     # If a deep dive country has been selected, add option to select subregion:
-    if region in ["Argentina", "Morocco", "South Africa"]:
-        subregions = api.get_dimension("region")["region_name"]
-        subregions = subregions.loc[
-            (subregions.str.startswith(region)) & (subregions != region)
-        ]
+    if region in DEEP_DIVE_COUNTRIES:
         subregion = st.selectbox(
             "Select subregion:",
-            subregions,
+            get_subregions(api)[region],
             index=None,
             help=(read_markdown_file("md/helptext_sidebar_supply_subregion.md")),
         )
@@ -93,30 +101,18 @@ def main_settings(api):
     with c1:
         product = st.selectbox(
             "Product:",
-            [
-                "Ammonia",
-                "Green Iron",
-                "Hydrogen",
-                "LOHC",
-                "Methane",
-                "Methanol",
-                "FT e-fuels",
-            ],
+            _PRODUCTS,
             help=read_markdown_file("md/helptext_sidebar_product.md"),
             index=0,  # Ammonia as default
         )
     with c2:
         st.session_state["electrolyzer"] = st.selectbox(
             "Electrolyzer type:",
-            [
-                "AEL",
-                "PEM",
-                "SOEC",
-            ],
+            _ELECTROLYZERS,
             help=read_markdown_file("md/helptext_sidebar_electrolyzer_type.md"),
             index=0,  # AEL as default
         )
-    if product in ["Ammonia", "Methane"]:
+    if product in _RECONVERSION_PRODUCTS:
         use_reconversion = st.toggle(
             "Include reconversion to H₂",
             help=(
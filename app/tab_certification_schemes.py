@@ -1,53 +1,50 @@
 # -*- coding: utf-8 -*-
 """Content of certification schemes tab."""
 import numpy as np
+import pandas as pd
 import streamlit as st
 
 from app.ptxboa_functions import read_markdown_file
 
+_LIFECYCLE_SCOPE_EXPLANATIONS = """
+**Explanations**
 
-def _render_scheme_info(context_data, scheme_name):
-    df = context_data["certification_schemes"]
-    data_with_na = df.loc[df["name"] == scheme_name].iloc[0].to_dict()
+- Info on "Lifecycle scope":
+  - Well-to-gate: GHG emissions are calculated up to production.
+  - Well-to-wheel: GHG emissions are calculated up to the time of use.
+  - Further information on the life cycle scopes can be found in
+IRENA & RMI (2023): Creating a global hydrogen market: certification to enable trade,
+ pp. 15-19
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _schemes_by_name(df: pd.DataFrame) -> pd.DataFrame:
+    """Index certification schemes by name and replace na with "not specified"."""
+    return df.set_index("name").replace(["", " "], np.nan).fillna("not specified")
 
-    # replace na with "not specified"
-    data = {}  # never modify a dict when iterating over it.
-    for key, value in data_with_na.items():
-        if value in ["", " ", np.nan]:
-            data[key] = "not specified"
-        else:
-            data[key] = value
+
+def _render_scheme_info(schemes, scheme_name):
+    data = schemes.loc[scheme_name].to_dict()
 
     st.markdown(data["description"])
 
     with st.expander("**Characteristics**"):
-        st.markdown(
+        characteristics = [
             (
                 f"- **Relation to other schemes, standards or regulations:** "
                 f"{data['relation_to_other_standards']}"
-            )
-        )
-        st.markdown(
+            ),
             (
                 f"- **Demand countries where this scheme, standard or regulation "
                 f"applies:** {data['ptxboa_demand_countries']}"
-            )
-        )
-        st.markdown(f"- **Labels:** {data['label']}")
-        st.markdown(f"- **Lifecycle scope:** {data['lifecycle_scope']}")
+            ),
+            f"- **Labels:** {data['label']}",
+            f"- **Lifecycle scope:** {data['lifecycle_scope']}",
+        ]
+        st.markdown("\n".join(characteristics))
 
-        st.markdown(
-            """
-**Explanations**
-
-- Info on "Lifecycle scope":
-  - Well-to-gate: GHG emissions are calculated up to production.
-  - Well-to-wheel: GHG emissions are calculated up to the time of use.
-  - Further information on the life cycle scopes can be found in
-IRENA & RMI (2023): Creating a global hydrogen market: certification to enable trade,
- pp. 15-19
-"""
-        )
+        st.markdown(_LIFECYCLE_SCOPE_EXPLANATIONS)
 
     with st.expander("**Scope**"):
         if data["scope_emissions"] != "not specified":
@@ -81,9 +78,8 @@ def content_certification_schemes(context_data: dict):
             unsafe_allow_html=True,
         )
 
+    schemes = _schemes_by_name(context_data["certification_schemes"])
     helptext = "Select the certification scheme you want to know more about."
-    scheme_name = st.selectbox(
-        "Select scheme:", context_data["certification_schemes"]["name"], help=helptext
-    )
+    scheme_name = st.selectbox("Select scheme:", schemes.index, help=helptext)
     with st.container(border=True):
-        _render_scheme_info(context_data=context_data, scheme_name=scheme_name)
+        _render_scheme_info(schemes=schemes, scheme_name=scheme_name)
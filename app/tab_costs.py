@@ -18,6 +18,13 @@ from app.ptxboa_functions import (
 from ptxboa.api import PtxboaAPI
 
 
+@st.cache_resource()
+def _get_res_gen_list(_api: PtxboaAPI) -> tuple[str, ...]:
+    """Get the renewable electricity sources compared in the costs tab."""
+    # TODO: here we remove PV tracking manually, fix in data
+    return tuple(x for x in _api.get_dimension("res_gen").index if x != "PV tracking")
+
+
 def content_costs(api: PtxboaAPI):
     with st.popover("*Help*", use_container_width=True):
         st.markdown(
@@ -72,31 +79,26 @@ def content_costs(api: PtxboaAPI):
             )
         )
 
-        # create box plot and bar plot:
-        fig1 = create_box_plot(costs_per_region)
-        filtered_data = costs_per_region[
-            costs_per_region.index == st.session_state["region"]
-        ]
-        fig2 = create_bar_chart_costs(filtered_data)
+        # create box plot and bar plot in one figure:
         doublefig = make_subplots(rows=1, cols=2, shared_yaxes=True)
+        create_box_plot(costs_per_region, fig=doublefig, row=1, col=1, showlegend=False)
+        region = st.session_state["region"]
+        if region in costs_per_region.index:
+            filtered_data = costs_per_region.loc[[region]]
+        else:
+            filtered_data = costs_per_region.iloc[:0]
+        doublefig.add_traces(create_bar_chart_costs(filtered_data).data, rows=1, cols=2)
 
-        for trace in fig1.data:
-            trace.showlegend = False
-            doublefig.add_trace(trace, row=1, col=1)
-        for trace in fig2.data:
-            doublefig.add_trace(trace, row=1, col=2)
-
-        doublefig.update_layout(barmode="stack")
-        doublefig.update_layout(legend_traceorder="reversed")
         doublefig.update_yaxes(title_text=st.session_state["output_unit"], row=1, col=1)
         doublefig.update_layout(
+            barmode="stack",
+            legend_traceorder="reversed",
             height=350,
             margin={"l": 10, "r": 10, "t": 20, "b": 20},
+            # set ticklabel format:
+            separators=". ",
         )
-
-        # set ticklabel format:
         doublefig.update_yaxes(tickformat=",")
-        doublefig.update_layout(separators=". ")
 
         st.plotly_chart(doublefig, use_container_width=True)
 
@@ -109,12 +111,10 @@ def content_costs(api: PtxboaAPI):
         )
 
     with st.container(border=True):
-        help_string = " ".join(
-            [
-                "This figure lets you compare total costs and cost components by source"
-                " region.\n\n By default, all regions are shown, and they are sorted by"
-                " total costs. You can change this in the filter settings."
-            ]
+        help_string = (
+            "This figure lets you compare total costs and cost components by source"
+            " region.\n\n By default, all regions are shown, and they are sorted by"
+            " total costs. You can change this in the filter settings."
         )
         display_costs(
             costs_per_region,
@@ -134,11 +134,9 @@ def content_costs(api: PtxboaAPI):
                     dim="scenario",
                 )
             )
-        help_string = " ".join(
-            [
-                "This figure lets you compare total costs and cost components"
-                " by data scenario (2030/2040, low/medium/high costs)."
-            ]
+        help_string = (
+            "This figure lets you compare total costs and cost components"
+            " by data scenario (2030/2040, low/medium/high costs)."
         )
         display_costs(
             costs_per_scenario,
@@ -159,19 +157,12 @@ def content_costs(api: PtxboaAPI):
                 costs_over_dimension(
                     api,
                     dim="res_gen",
-                    # TODO: here we remove PV tracking manually, fix in data
-                    parameter_list=[
-                        x
-                        for x in api.get_dimension("res_gen").index.to_list()
-                        if x != "PV tracking"
-                    ],
+                    parameter_list=list(_get_res_gen_list(api)),
                 )
             )
-        help_string = " ".join(
-            [
-                "This figure lets you compare total costs and cost components"
-                "by renewable electricity source."
-            ]
+        help_string = (
+            "This figure lets you compare total costs and cost components"
+            " by renewable electricity source."
         )
         display_costs(
             costs_per_res_gen,
@@ -192,15 +183,13 @@ def content_costs(api: PtxboaAPI):
                     override_session_state={"output_unit": "USD/MWh"},
                 )
             )
-        help_string = " ".join(
-            [
-                "This figure lets you compare total costs and cost components"
-                " for different products and electrolyser types."
-                "\n\n"
-                "By default, all products are shown, and the electrolyser type"
-                " that is chosen in the sidebar is used."
-                " You can change this in the filter settings."
-            ]
+        help_string = (
+            "This figure lets you compare total costs and cost components"
+            " for different products and electrolyser types."
+            "\n\n"
+            "By default, all products are shown, and the electrolyser type"
+            " that is chosen in the sidebar is used."
+            " You can change this in the filter settings."
         )
         display_costs(
             costs_per_chain,
@@ -209,10 +198,10 @@ def content_costs(api: PtxboaAPI):
             "Costs for different products and electrolyser types",
             output_unit="USD/MWh",
             default_select=1,
-            default_manual_select=[
-                x
-                for x in costs_per_chain.index
-                if st.session_state["electrolyzer"] in x
-            ],
+            default_manual_select=costs_per_chain.index[
+                costs_per_chain.index.str.contains(
+                    st.session_state["electrolyzer"], regex=False
+                )
+            ].to_list(),
             help_string=help_string,
         )
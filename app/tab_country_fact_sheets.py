@@ -2,31 +2,38 @@
 """Content of country fact sheets tab and functions to create it."""
 import streamlit as st
 
-from app.ptxboa_functions import get_region_from_subregion, read_markdown_file
+from app.ptxboa_functions import (
+    get_region_from_subregion,
+    get_region_iso3166_codes,
+    read_markdown_file,
+)
 from ptxboa.api import PtxboaAPI
 
+_FLAGS_TO_COUNTRIES = {
+    "France": ":flag-fr:",
+    "Germany": ":flag-de:",
+    "Netherlands": ":flag-nl:",
+    "Spain": ":flag-es:",
+    "China": ":flag-cn:",
+    "India": ":flag-in:",
+    "Japan": ":flag-jp:",
+    "South Korea": ":flag-kr:",
+    "USA": ":flag-us:",
+}
+
+
+def _markdown_with_source(text: str, source: str):
+    """Display a text and its source in a single markdown element."""
+    st.markdown(f"{text}\n\n*Source: {source}*")
+
 
 def _create_fact_sheet_demand_country(context_data: dict):
     # select country:
     country_name = st.session_state["country"]
     df = context_data["demand_countries"]
-    data = df.loc[df["country_name"] == country_name].iloc[0].to_dict()
-
-    flags_to_country_names = {
-        "France": ":flag-fr:",
-        "Germany": ":flag-de:",
-        "Netherlands": ":flag-nl:",
-        "Spain": ":flag-es:",
-        "China": ":flag-cn:",
-        "India": ":flag-in:",
-        "Japan": ":flag-jp:",
-        "South Korea": ":flag-kr:",
-        "USA": ":flag-us:",
-    }
-
-    st.subheader(
-        f"{flags_to_country_names[country_name]} Fact sheet for {country_name}"
-    )
+    data = df.loc[country_name].to_dict()
+
+    st.subheader(f"{_FLAGS_TO_COUNTRIES[country_name]} Fact sheet for {country_name}")
     with st.expander("**Demand**"):
         c1, c2, c3 = st.columns(3)
         with c1:
@@ -34,15 +41,18 @@ def _create_fact_sheet_demand_country(context_data: dict):
             if data["h2_demand_2030"] in ["", "-", "n/a"]:
                 st.markdown("no data")
             else:
-                st.markdown(data["h2_demand_2030"])
-                st.markdown(f"*Source: {data['source_h2_demand_2030']}*")
+                _markdown_with_source(
+                    data["h2_demand_2030"], data["source_h2_demand_2030"]
+                )
         with c2:
             st.markdown("**Targeted sectors (main)**")
             if data["demand_targeted_sectors_main"] in ["", "-", "n/a"]:
                 st.markdown("no data")
             else:
-                st.markdown(data["demand_targeted_sectors_main"])
-                st.markdown(f"*Source: {data['source_targeted_sectors_main']}*")
+                _markdown_with_source(
+                    data["demand_targeted_sectors_main"],
+                    data["source_targeted_sectors_main"],
+                )
         with c3:
             st.markdown("**Targeted sectors (secondary)**")
             if data["demand_targeted_sectors_secondary"] in [
@@ -53,8 +63,10 @@ def _create_fact_sheet_demand_country(context_data: dict):
             ]:
                 st.markdown("no data")
             else:
-                st.markdown(data["demand_targeted_sectors_secondary"])
-                st.markdown(f"*Source: {data['source_targeted_sectors_secondary']}*")
+                _markdown_with_source(
+                    data["demand_targeted_sectors_secondary"],
+                    data["source_targeted_sectors_secondary"],
+                )
 
     with st.expander("**Hydrogen strategy**"):
         st.markdown("**Documents**")
@@ -64,29 +76,33 @@ def _create_fact_sheet_demand_country(context_data: dict):
         st.markdown(data["h2_strategy_authorities"])
 
     with st.expander("**Hydrogen trade characteristics**"):
-        st.markdown(data["h2_trade_characteristics"])
-        st.markdown(f"*Source: {data['source_h2_trade_characteristics']}*")
+        _markdown_with_source(
+            data["h2_trade_characteristics"], data["source_h2_trade_characteristics"]
+        )
 
     with st.expander("**Infrastructure**"):
         st.markdown("**LNG import terminals**")
-        st.markdown(data["lng_import_terminals"])
-        st.markdown(f"*Source: {data['source_lng_import_terminals']}*")
+        _markdown_with_source(
+            data["lng_import_terminals"], data["source_lng_import_terminals"]
+        )
 
         st.markdown("**Hydrogen pipeline projects**")
-        st.markdown(data["h2_pipeline_projects"])
-        st.markdown(f"*Source: {data['source_h2_pipeline_projects']}*")
+        _markdown_with_source(
+            data["h2_pipeline_projects"], data["source_h2_pipeline_projects"]
+        )
 
     if (
         len(data["certification_info"]) > 1
     ):  # workaround, empty data sometimes contains "-"
         with st.expander("**Additional information on certification**"):
-            st.markdown(data["certification_info"])
-            st.markdown(f"*Source: {data['source_certification_info']}*")
+            _markdown_with_source(
+                data["certification_info"], data["source_certification_info"]
+            )
 
 
 def _create_fact_sheet_supply_country(context_data: dict, api: PtxboaAPI):
     """Display information on a chosen supply country."""
-    alpha2_codes = api.get_dimension("region")["iso3166_code"].to_dict()
+    alpha2_codes = get_region_iso3166_codes(api)
 
     # select region:
     country_name = st.session_state["region"]
@@ -94,7 +110,7 @@ def _create_fact_sheet_supply_country(context_data: dict, api: PtxboaAPI):
     # for subregions, select name of region they belong to:
     region_name = get_region_from_subregion(country_name)
     df = context_data["supply"]
-    data = df.loc[df["country_name"] == region_name].iloc[0].to_dict()
+    data = df.loc[region_name].to_dict()
 
     flag = f":flag-{alpha2_codes[region_name]}:".lower()
 
@@ -12,6 +12,7 @@ from app.layout_elements import (
 from app.plot_functions import plot_costs_on_map, plot_input_data_on_map
 from app.ptxboa_functions import (
     costs_over_dimension,
+    get_subregions,
     read_markdown_file,
     select_subregions,
 )
@@ -52,9 +53,7 @@ def content_deep_dive_countries(api: PtxboaAPI) -> None:
         costs_per_region, costs_per_region_without_user_changes = costs_over_dimension(
             api,
             dim="region",
-            parameter_list=[
-                x for x in api.get_dimension("region").index if x.startswith(f"{ddc} (")
-            ],
+            parameter_list=list(get_subregions(api)[ddc]),
         )
 
     with st.container(border=True):
@@ -76,14 +75,12 @@ def content_deep_dive_countries(api: PtxboaAPI) -> None:
 
         st.divider()
 
-        help_string = " ".join(
-            [
-                "This figure lets you compare total costs and cost components by"
-                " subregion."
-                "\n\n"
-                "By default, all subregions are shown, and they are sorted by"
-                " total costs. You can change this in the filter settings."
-            ]
+        help_string = (
+            "This figure lets you compare total costs and cost components by"
+            " subregion."
+            "\n\n"
+            "By default, all subregions are shown, and they are sorted by"
+            " total costs. You can change this in the filter settings."
         )
         display_costs(
             select_subregions(costs_per_region, ddc),
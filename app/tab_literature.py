@@ -28,12 +28,11 @@ def content_literature(context_data: dict):
 
     st.markdown("## References")
     df = context_data["literature"]
-    markdown_text = ""
-    for _ind, row in df.iterrows():
-        if _is_valid_url(row["url"]):
-            text = f"- {row['long_name'].strip('.')} ([Link]({row['url']}))\n"
+    lines = []
+    for row in df.itertuples(index=False):
+        if _is_valid_url(row.url):
+            lines.append(f"- {row.long_name.strip('.')} ([Link]({row.url}))\n")
         else:
-            text = f"- {row['long_name']}\n"
-        markdown_text = markdown_text + text
+            lines.append(f"- {row.long_name}\n")
 
-    st.markdown(markdown_text)
+    st.markdown("".join(lines))
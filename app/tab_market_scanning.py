@@ -10,6 +10,8 @@ from app.ptxboa_functions import (
     change_index_names,
     config_number_columns,
     get_region_list_without_subregions,
+    get_subregions,
+    get_transport_distances,
     read_markdown_file,
 )
 from ptxboa.api import PtxboaAPI
@@ -44,20 +46,11 @@ def content_market_scanning(api: PtxboaAPI, cd: dict) -> None:
             ),
         )
 
-    # get input data:
-    input_data = api.get_input_data(st.session_state["scenario"])
-
-    # filter shipping and pipeline distances:
-    distances = input_data.loc[
-        (input_data["parameter_code"].isin(["shipping distance", "pipeline distance"]))
-        & (input_data["target_country_code"] == st.session_state["country"]),
-        ["source_region_code", "parameter_code", "value"],
-    ]
-    distances = distances.pivot_table(
-        index="source_region_code",
-        columns="parameter_code",
-        values="value",
-        aggfunc="sum",
+    # select shipping and pipeline distances to the target country:
+    distances = (
+        get_transport_distances(api, st.session_state["scenario"])
+        .xs(st.session_state["country"], level="target_country_code")
+        .dropna(axis=1, how="all")
     )
 
     # merge costs and distances:
@@ -67,9 +60,7 @@ def content_market_scanning(api: PtxboaAPI, cd: dict) -> None:
 
     # merge RE supply potential from context data:
     df = df.merge(
-        cd["supply"].set_index("country_name")[
-            ["re_tech_pot_EWI", "re_tech_pot_PTXAtlas"]
-        ],
+        cd["supply"][["re_tech_pot_EWI", "re_tech_pot_PTXAtlas"]],
         left_index=True,
         right_index=True,
         how="left",
@@ -96,9 +87,7 @@ def content_market_scanning(api: PtxboaAPI, cd: dict) -> None:
     # subregions:
     if st.session_state["subregion"] is not None:
         region = st.session_state["region"].split(" (")[0]
-        number_of_subregions = (
-            api.get_dimension("region")["region_name"].str.startswith(region).sum() - 1
-        )
+        number_of_subregions = len(get_subregions(api)[region])
         for par in [
             "RE technical potential (PTX Atlas) (TWh/a)",
             "RE technical potential (EWI) (TWh/a)",
@@ -196,21 +185,11 @@ def content_market_scanning(api: PtxboaAPI, cd: dict) -> None:
             " to different target countries"
         )
 
-        # filter shipping and pipeline distances:
-        df = input_data.loc[
-            (
-                input_data["parameter_code"].isin(
-                    ["shipping distance", "pipeline distance"]
-                )
-            )
-            & (input_data["source_region_code"] == st.session_state["region"]),
-            ["target_country_code", "parameter_code", "value"],
-        ]
-        df = df.pivot_table(
-            index="target_country_code",
-            columns="parameter_code",
-            values="value",
-            aggfunc="sum",
+        # select shipping and pipeline distances from the source region:
+        df = (
+            get_transport_distances(api, st.session_state["scenario"])
+            .xs(st.session_state["region"], level="source_region_code")
+            .dropna(axis=1, how="all")
         )
 
         # merge H2 demand from context data:
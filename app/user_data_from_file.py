@@ -7,6 +7,8 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+from app.ptxboa_functions import get_input_data
+
 logger = logging.getLogger()
 
 
@@ -129,21 +131,19 @@ def _validate_user_dataframe(api, scenario, result: str | pd.DataFrame):
 
 def _validate_correct_index_combinations(api, scenario, result):
     # check that index-column combination is present in input data:
-    input_data = api.get_input_data(scenario, long_names=True)
-    for row in result.itertuples():
-        selector = (
-            (input_data["parameter_code"] == row.parameter_code)
-            & (input_data["process_code"] == row.process_code)
-            & (input_data["flow_code"] == row.flow_code)
-            & (input_data["source_region_code"] == row.source_region_code)
-            & (input_data["target_country_code"] == "")
+    input_data = get_input_data(api, scenario, long_names=True)
+    index_cols = ["parameter_code", "process_code", "flow_code", "source_region_code"]
+    valid_combinations = pd.MultiIndex.from_frame(
+        input_data.loc[input_data["target_country_code"] == "", index_cols]
+    )
+    is_valid = pd.MultiIndex.from_frame(result[index_cols]).isin(valid_combinations)
+    if not is_valid.all():
+        # report the first invalid row:
+        row = next(result.loc[~is_valid].itertuples())
+        result = (
+            f"invalid index combination '{row.source_region_code} "
+            f"| {row.process_code} | {row.parameter_code} | {row.flow_code}'"
         )
-        if len(input_data.loc[selector]) == 0:
-            result = (
-                f"invalid index combination '{row.source_region_code} "
-                f"| {row.process_code} | {row.parameter_code} | {row.flow_code}'"
-            )
-            break
     return result
 
 
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Unittests for plot_functions module."""
+
+import unittest
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from app.plot_functions import create_bar_chart_costs
+from app.ptxboa_functions import aggregate_costs
+from ptxboa import DEFAULT_DATA_DIR
+from ptxboa.api import PtxboaAPI
+
+colors_file = Path(__file__).parent.parent / "data" / "Agora_Industry_Colours.csv"
+
+
+class TestPlotFunctions(unittest.TestCase):
+    def test_create_bar_chart_costs_unique_colors(self):
+        """Each cost component gets its own color, also for pipeline transport."""
+        colors = pd.read_csv(colors_file)
+        st.session_state["colors"] = colors["Hex Code"].to_list()
+        api = PtxboaAPI(data_dir=DEFAULT_DATA_DIR)
+        res_list = [
+            api.calculate(
+                scenario="2040 (medium)",
+                secproc_co2="Direct Air Capture",
+                secproc_water="Sea Water desalination",
+                chain=chain,
+                res_gen="Wind-PV-Hybrid",
+                region="Morocco",
+                country="Germany",
+                transport="Pipeline",
+                ship_own_fuel=False,
+                optimize_flh=False,
+            )[0]
+            for chain in ["Hydrogen (AEL)", "Methane (AEL)"]
+        ]
+        res_costs = aggregate_costs(pd.concat(res_list), "chain")
+        self.assertIn("Transportation (Pipeline)", res_costs.columns)
+
+        fig = create_bar_chart_costs(res_costs, output_unit="USD/MWh")
+        bar_colors = [trace.marker.color for trace in fig.data if trace.type == "bar"]
+        self.assertEqual(len(bar_colors), len(res_costs.columns) - 1)
+        self.assertEqual(len(set(bar_colors)), len(bar_colors))
+
+        # cost components without a category color get a color of their own:
+        res_costs.insert(0, "Unknown", 1.0)
+        fig = create_bar_chart_costs(res_costs, output_unit="USD/MWh")
+        bar_colors = [trace.marker.color for trace in fig.data if trace.type == "bar"]
+        self.assertEqual(len(set(bar_colors)), len(bar_colors))
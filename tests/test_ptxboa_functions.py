@@ -57,3 +57,24 @@ class TestPtxboaFunctions(unittest.TestCase):
         df_out = pf.remove_subregions(api, df_in, settings["country"])
         self.assertEqual(len(df_out), 33)
         self.assertFalse("China" in df_out["region_name"])
+
+    def test_get_user_data_hash(self):
+        """Test that the user data hash only depends on the content."""
+        self.assertIsNone(pf.get_user_data_hash(None))
+
+        df = pd.DataFrame(
+            {
+                "source_region_code": ["ARE"],
+                "process_code": ["PV-FIX"],
+                "parameter_code": ["CAPEX"],
+                "flow_code": [""],
+                "value": [1000.0],
+            }
+        )
+        self.assertEqual(pf.get_user_data_hash(df), pf.get_user_data_hash(df.copy()))
+
+        df_changed = df.copy()
+        df_changed["value"] = 2000.0
+        self.assertNotEqual(
+            pf.get_user_data_hash(df), pf.get_user_data_hash(df_changed)
+        )